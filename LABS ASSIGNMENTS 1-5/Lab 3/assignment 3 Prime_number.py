@@ -1,3 +1,9 @@
+try:
+    from hotpath import instrument
+except ImportError:  # instrumentation is optional: run uninstrumented without hotpath
+    def instrument(name=None):
+        return lambda func: func
+
 # Implementations from different prompting strategies
 
 # Zero-Shot
@@ -30,6 +36,7 @@ def is_prime_few_shot(n):
     return "Prime"
 
 # Context-Managed (Optimized)
+@instrument("primes.is_prime_context")
 def is_prime_context(n):
     if n <= 1:
         return False
@@ -2,6 +2,12 @@ import json
 import hashlib
 import os
 
+try:
+    from hotpath import instrument
+except ImportError:  # instrumentation is optional: run uninstrumented without hotpath
+    def instrument(name=None):
+        return lambda func: func
+
 # File to store user data
 USER_FILE = "users.json"
 
@@ -13,11 +19,13 @@ def load_users():
     return {}
 
 # Save users to file
+@instrument("users.save_users")
 def save_users(users):
     with open(USER_FILE, "w") as f:
         json.dump(users, f, indent=4)
 
 # Hash password using SHA256
+@instrument("users.hash_password")
 def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
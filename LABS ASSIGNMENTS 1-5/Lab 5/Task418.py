@@ -31,7 +31,14 @@ When to use:
 from typing import List
 import random
 
+try:
+    from hotpath import instrument
+except ImportError:  # instrumentation is optional: run uninstrumented without hotpath
+    def instrument(name=None):
+        return lambda func: func
 
+
+@instrument("sorting.quicksort")
 def quicksort(arr: List[int]) -> List[int]:
     """
     In-place quicksort (Lomuto partition) with a randomized pivot to avoid
@@ -23,24 +23,25 @@ def factorial(n):
 
 
 # --- Main Program ---
-# Ask the user for input
-num = int(input("Enter a number to find its factorial: "))
-
-# Call factorial function
-result = factorial(num)
-
-# Display result
-print(f"\n✅ Factorial of {num} is {result}\n")
-
-# --- Summary of the algorithm ---
-print("📌 Summary of Flow:")
-print("1. Used recursion with memoization (dynamic programming).")
-print("2. Base case: factorial(0) = factorial(1) = 1.")
-print("3. Recursive case: n! = n × factorial(n-1).")
-print("4. Stored computed values in 'memo' to avoid recalculating.")
-print("5. Final result obtained by combining results from recursive calls.\n")
-
-# Show memo contents for clarity
-print("🗂️ Stored intermediate results in memo:")
-for key in sorted(memo.keys()):
-    print(f"{key}! = {memo[key]}")
+if __name__ == "__main__":
+    # Ask the user for input
+    num = int(input("Enter a number to find its factorial: "))
+
+    # Call factorial function
+    result = factorial(num)
+
+    # Display result
+    print(f"\n✅ Factorial of {num} is {result}\n")
+
+    # --- Summary of the algorithm ---
+    print("📌 Summary of Flow:")
+    print("1. Used recursion with memoization (dynamic programming).")
+    print("2. Base case: factorial(0) = factorial(1) = 1.")
+    print("3. Recursive case: n! = n × factorial(n-1).")
+    print("4. Stored computed values in 'memo' to avoid recalculating.")
+    print("5. Final result obtained by combining results from recursive calls.\n")
+
+    # Show memo contents for clarity
+    print("🗂️ Stored intermediate results in memo:")
+    for key in sorted(memo.keys()):
+        print(f"{key}! = {memo[key]}")
@@ -0,0 +1 @@
+"""Shared library code for the AI-assisted coding lab assignments."""
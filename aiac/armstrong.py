@@ -0,0 +1,24 @@
+"""Armstrong number check with an explanation (Lab 5, Task 3)."""
+
+from typing import Tuple
+
+
+def is_armstrong(number: int) -> Tuple[bool, str]:
+    """Return (is_armstrong, explanation) for a non-negative integer."""
+    digits = str(number)
+    num_digits = len(digits)
+    powered_values = [int(digit) ** num_digits for digit in digits]
+    total = sum(powered_values)
+
+    power_exp = " + ".join(f"{d}^{num_digits}" for d in digits)
+    calc_exp = " + ".join(str(val) for val in powered_values)
+
+    if total == number:
+        return True, (
+            f"✅ {number} is an Armstrong number!\n"
+            f"Explanation: {power_exp} = {calc_exp} = {total}"
+        )
+    return False, (
+        f"❌ {number} is NOT an Armstrong number.\n"
+        f"Explanation: {power_exp} = {calc_exp} = {total} (≠ {number})"
+    )
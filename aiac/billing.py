@@ -0,0 +1,314 @@
+"""
+LPG cylinder and mobile data bills (Lab 5, Cylinder.py and Sim.py), and a
+streaming aggregator for the distributor network's daily booking logs.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# LPG price per cylinder, keyed by the lower-cased cylinder type
+PRICES = {
+    "domestic 14.2kg": 905.00,
+    "domestic 5kg": 335.50,
+    "commercial 19kg": 1886.50,
+    "commercial 47.5kg": 4712.00,
+}
+
+# Value-added service charges on a SIM bill
+SERVICE_RATES = {
+    "caller tune": 30,
+    "ott subscription": 100,
+    "international roaming": 200,
+}
+
+GST_RATE = 0.18
+
+# Customers tracked individually before the rest are pooled under OTHER_CUSTOMERS
+MAX_CUSTOMERS = 10000
+OTHER_CUSTOMERS = "(other)"
+# Error messages kept for rejected (malformed) booking records
+MAX_ERRORS = 20
+
+Booking = Dict[str, Any]
+Counter = List[Any]  # [bookings, cylinders, amount]
+
+
+# ---------------- LPG cylinder bill ----------------
+
+def normalize_cylinder_type(cylinder_type: str) -> str:
+    """Return the cylinder type in the form used as a PRICES key."""
+    return " ".join(cylinder_type.lower().split())
+
+
+def get_cylinder_price(cylinder_type: str) -> float:
+    """Return price per cylinder based on type (0 for an unknown type)."""
+    return PRICES.get(normalize_cylinder_type(cylinder_type), 0)
+
+
+def calculate_bill(cylinder_type: str, quantity: int, delivery_charges: float,
+                   subsidy: float = 0) -> Tuple[float, float, float]:
+    """Return (base_amount, subsidy, total_bill); subsidy applies to domestic cylinders only."""
+    base_amount = get_cylinder_price(cylinder_type) * quantity
+    if "domestic" not in normalize_cylinder_type(cylinder_type):
+        subsidy = 0
+    total_bill = base_amount + subsidy + delivery_charges
+    return base_amount, subsidy, total_bill
+
+
+# ---------------- SIM data bill ----------------
+
+def calculate_data_charges(data_gb: float, plan_type: str) -> float:
+    """Calculate data charges: Rs. 10 per GB on pre-paid plans, Rs. 8 per GB on post-paid."""
+    rate = 10 if plan_type.lower() == "pre-paid" else 8
+    return data_gb * rate
+
+
+def calculate_value_added_charges(services: Iterable[str]) -> float:
+    """Calculate charges for value-added services."""
+    return sum(SERVICE_RATES.get(service.lower(), 0) for service in services)
+
+
+def calculate_tax(amount: float) -> float:
+    """Calculate tax (18% GST)."""
+    return amount * GST_RATE
+
+
+def sim_bill(data_gb: float, plan_type: str, services: Iterable[str] = ()) -> Tuple[float, float, float, float]:
+    """Return (data_charges, value_added_charges, tax, total)."""
+    dc = calculate_data_charges(data_gb, plan_type)
+    vc = calculate_value_added_charges(services)
+    tax = calculate_tax(dc + vc)
+    return dc, vc, tax, dc + vc + tax
+
+
+# ---------------- Booking log aggregation ----------------
+# A booking log is a CSV file with one booking per line:
+#   date,customer,cylinder_type,quantity,delivery_charges[,subsidy]
+# An optional header line starting with "date," is skipped.
+
+def parse_booking(line: str) -> Booking:
+    """Return the booking dict for one log line; raises ValueError if it is malformed."""
+    fields = next(csv.reader([line]))
+    if len(fields) < 5:
+        raise ValueError("expected date,customer,cylinder_type,quantity,delivery_charges[,subsidy]")
+    cylinder_type = normalize_cylinder_type(fields[2])
+    if cylinder_type not in PRICES:
+        raise ValueError(f"unknown cylinder type {fields[2].strip()!r}")
+    try:
+        quantity = int(fields[3])
+        delivery_charges = float(fields[4])
+        subsidy = float(fields[5]) if len(fields) > 5 and fields[5].strip() else 0.0
+    except ValueError as e:
+        raise ValueError(f"bad number ({e})") from None
+    if quantity < 0:
+        raise ValueError(f"negative quantity {quantity}")
+    return {
+        "date": fields[0].strip(),
+        "customer": fields[1].strip(),
+        "cylinder_type": cylinder_type,
+        "quantity": quantity,
+        "delivery_charges": delivery_charges,
+        "subsidy": subsidy,
+    }
+
+
+def read_booking_lines(path: str, offset: int = 0) -> Iterator[Tuple[int, int, str]]:
+    """
+    Lazily yield (line_offset, next_offset, line) for each record in a booking log.
+
+    Reading starts at the byte `offset`; `next_offset` is the position just
+    after the record, so it can be stored as a resume checkpoint. Blank lines
+    and the header are skipped. A last line without a newline may still be
+    being written, so reading stops in front of it and the next run reads it
+    again once it is complete.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in iter(f.readline, b""):
+            if not raw.endswith(b"\n"):
+                return
+            line_offset = offset
+            offset += len(raw)
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line or line.lower().startswith("date,"):
+                continue
+            yield line_offset, offset, line
+
+
+def log_identity(path: str) -> Dict[str, Any]:
+    """
+    Return what identifies a booking log across runs: its path, inode and a
+    hash of its first line. Appending to the log keeps the identity; a new
+    day's file, or a rotated one at the same path, does not.
+    """
+    with open(path, "rb") as f:
+        first_line = f.readline()
+    return {
+        "path": os.path.abspath(path),
+        "inode": os.stat(path).st_ino,
+        "first_line_sha256": hashlib.sha256(first_line).hexdigest(),
+    }
+
+
+class BookingAggregator:
+    """
+    Running totals per cylinder type, per day and per customer.
+
+    Each counter is a compact [bookings, cylinders, amount] list. At most
+    `max_customers` customers are tracked by name; bookings from any further
+    customers are added to the OTHER_CUSTOMERS bucket so memory stays bounded.
+    Malformed records are counted in `rejected`, keeping only the last
+    MAX_ERRORS error messages.
+    """
+
+    def __init__(self, max_customers: int = MAX_CUSTOMERS) -> None:
+        self.max_customers = max_customers
+        self.log: Optional[Dict[str, Any]] = None
+        self.offset = 0
+        self.by_type: Dict[str, Counter] = {}
+        self.by_day: Dict[str, Counter] = {}
+        self.by_customer: Dict[str, Counter] = {}
+        self.rejected = 0
+        self.errors: List[str] = []
+
+    def reject(self, message: str) -> None:
+        """Count a malformed record, remembering its error message."""
+        self.rejected += 1
+        self.errors.append(message)
+        del self.errors[:-MAX_ERRORS]
+
+    @staticmethod
+    def _add(table: Dict[str, Counter], key: str, quantity: int, amount: float) -> None:
+        counter = table.get(key)
+        if counter is None:
+            table[key] = [1, quantity, amount]
+        else:
+            counter[0] += 1
+            counter[1] += quantity
+            counter[2] += amount
+
+    def add(self, booking: Booking) -> float:
+        """Price one booking and fold it into the running totals."""
+        _, _, total = calculate_bill(
+            booking["cylinder_type"], booking["quantity"],
+            booking["delivery_charges"], booking["subsidy"]
+        )
+        quantity = booking["quantity"]
+        customer = booking["customer"]
+        if customer not in self.by_customer and len(self.by_customer) >= self.max_customers:
+            customer = OTHER_CUSTOMERS
+        self._add(self.by_type, booking["cylinder_type"], quantity, total)
+        self._add(self.by_day, booking["date"], quantity, total)
+        self._add(self.by_customer, customer, quantity, total)
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "log": self.log,
+            "offset": self.offset,
+            "max_customers": self.max_customers,
+            "by_type": self.by_type,
+            "by_day": self.by_day,
+            "by_customer": self.by_customer,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BookingAggregator":
+        aggregator = cls(data.get("max_customers", MAX_CUSTOMERS))
+        aggregator.log = data.get("log")
+        aggregator.offset = data["offset"]
+        aggregator.by_type = data["by_type"]
+        aggregator.by_day = data["by_day"]
+        aggregator.by_customer = data["by_customer"]
+        aggregator.rejected = data.get("rejected", 0)
+        aggregator.errors = data.get("errors", [])
+        return aggregator
+
+
+def save_checkpoint(aggregator: BookingAggregator, path: str) -> None:
+    """Atomically write the aggregator state (including the log offset) to `path`."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(aggregator.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: Optional[str], max_customers: int = MAX_CUSTOMERS) -> BookingAggregator:
+    """
+    Return the aggregator saved at `path`, or a fresh one if there is none.
+    `max_customers` applies to a resumed aggregator too; customers already
+    tracked by name stay tracked.
+    """
+    if path and os.path.exists(path):
+        with open(path, "r") as f:
+            aggregator = BookingAggregator.from_dict(json.load(f))
+        aggregator.max_customers = max_customers
+        return aggregator
+    return BookingAggregator(max_customers)
+
+
+def process_bookings(log_path: str, checkpoint_path: Optional[str] = None, checkpoint_every: int = 1000,
+                     max_customers: int = MAX_CUSTOMERS) -> BookingAggregator:
+    """
+    Stream a booking log into a BookingAggregator.
+
+    With `checkpoint_path`, processing resumes from the last saved offset and
+    the state is saved every `checkpoint_every` bookings and once at the end.
+    A checkpoint taken on a different log (see log_identity) raises
+    ValueError instead of seeking into the wrong file. Malformed records are
+    skipped and counted, so a bad line cannot block resuming.
+    """
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be at least 1, not {checkpoint_every}")
+    aggregator = load_checkpoint(checkpoint_path, max_customers)
+    identity = log_identity(log_path)
+    if aggregator.offset:
+        if aggregator.log != identity:
+            saved = (aggregator.log or {}).get("path", "an unknown log")
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was taken on {saved}, which does not match "
+                f"{identity['path']}; use a new checkpoint file for a new log."
+            )
+        if os.path.getsize(log_path) < aggregator.offset:
+            raise ValueError(
+                f"{log_path} is shorter than the checkpoint offset {aggregator.offset}; "
+                "it was truncated or replaced."
+            )
+    aggregator.log = identity
+
+    pending = 0
+    for line_offset, offset, line in read_booking_lines(log_path, aggregator.offset):
+        try:
+            aggregator.add(parse_booking(line))
+        except ValueError as e:
+            aggregator.reject(f"byte {line_offset}: {e}: {line!r}")
+        aggregator.offset = offset
+        pending += 1
+        if checkpoint_path and pending >= checkpoint_every:
+            save_checkpoint(aggregator, checkpoint_path)
+            pending = 0
+    if checkpoint_path:
+        save_checkpoint(aggregator, checkpoint_path)
+    return aggregator
+
+
+def print_summary(aggregator: BookingAggregator) -> None:
+    """Print the aggregated totals as tables."""
+    for title, table in (("Cylinder Type", aggregator.by_type),
+                         ("Day", aggregator.by_day),
+                         ("Customer", aggregator.by_customer)):
+        print(f"\n--- Totals by {title} ---")
+        print(f"{title:<20} {'Bookings':>10} {'Cylinders':>10} {'Amount (Rs.)':>15}")
+        print("-" * 58)
+        for key in sorted(table):
+            bookings, cylinders, amount = table[key]
+            print(f"{key:<20} {bookings:>10} {cylinders:>10} {amount:>15.2f}")
+    if aggregator.rejected:
+        print(f"\n--- Rejected Records: {aggregator.rejected} (latest shown) ---")
+        for message in aggregator.errors:
+            print(message)
@@ -0,0 +1,226 @@
+"""
+Single command-line entry point: `aiac <command> ...`.
+
+Only argparse is imported up front; each command imports its module when it
+runs, so `aiac primes` never pays for scikit-learn or requests.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+
+def _missing_extra(extra: str, error: ImportError) -> int:
+    print(f"[x] {error.name or error}: not installed. Install it with: pip install 'aiac[{extra}]'",
+          file=sys.stderr)
+    return 1
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def _primes(args: argparse.Namespace) -> int:
+    from .primes import is_prime, primes_up_to
+
+    if args.upto:
+        print(" ".join(str(p) for p in primes_up_to(args.upto)))
+    for n in args.numbers:
+        print(f"{n}: {'Prime' if is_prime(n) else 'Not Prime'}")
+    return 0
+
+
+def _factorial(args: argparse.Namespace) -> int:
+    from .factorial import factorial
+
+    try:
+        print(factorial(args.n))
+    except ValueError as e:
+        print(f"Invalid input: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _sort(args: argparse.Namespace) -> int:
+    from .sorting import bubble_sort, quicksort
+
+    sort = bubble_sort if args.algorithm == "bubble" else quicksort
+    print(" ".join(str(v) for v in sort(list(args.values))))
+    return 0
+
+
+def _armstrong(args: argparse.Namespace) -> int:
+    from .armstrong import is_armstrong
+
+    ok = True
+    for n in args.numbers:
+        result, message = is_armstrong(n)
+        ok = ok and result
+        print(message)
+    return 0 if ok else 1
+
+
+def _weather(args: argparse.Namespace) -> int:
+    from .weather import fetch_weather, format_weather, load_api_key
+
+    try:
+        import requests  # noqa: F401 - checked before prompting for a city or key
+    except ImportError as e:
+        return _missing_extra("weather", e)
+
+    # If no city was passed, ask interactively
+    city = args.city or input("Enter the city name: ").strip()
+    api_key = load_api_key(interactive=sys.stdin.isatty(), dotenv_dir=args.dotenv_dir)
+    result = fetch_weather(city, units=args.units, api_key=api_key)
+    if "error" in result:
+        print(f"[x] {result['error']}", file=sys.stderr)
+        if "detail" in result:
+            print(result["detail"], file=sys.stderr)
+        return 1
+
+    data = result["data"]
+    if args.json:
+        import json
+
+        print(json.dumps(data, indent=2))
+    else:
+        print(format_weather(data))
+    return 0
+
+
+def _users(args: argparse.Namespace) -> int:
+    from .users import load_users, register_user
+
+    if args.action == "add":
+        if not (args.name and args.email and args.password):
+            print("users add needs --name, --email and --password", file=sys.stderr)
+            return 2
+        if not register_user(args.name, args.email, args.password, args.file):
+            print("Email already registered.", file=sys.stderr)
+            return 1
+        print("User registered successfully!")
+        return 0
+
+    users = load_users(args.file)
+    print(f"{'Name':<20} {'Email':<30}")
+    print("-" * 55)
+    for email, data in users.items():
+        print(f"{data['name']:<20} {email:<30}")
+    return 0
+
+
+def _recommend(args: argparse.Namespace) -> int:
+    from .recommend import recommend_products
+
+    try:
+        results = recommend_products(args.product, top_n=args.top)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 1
+    except ImportError as e:
+        return _missing_extra("recommend", e)
+    print(f"🛒 Because you viewed **{args.product}**, we recommend:")
+    for rec in results:
+        print(f"- {rec['product']} (Similarity: {rec['similarity']})")
+        print(f"  👉 Reasons: {', '.join(rec['reasons'])}")
+    return 0
+
+
+def _billing(args: argparse.Namespace) -> int:
+    from .billing import calculate_bill, print_summary, process_bookings, sim_bill
+
+    if args.kind == "log":
+        try:
+            aggregator = process_bookings(args.log, args.checkpoint, args.checkpoint_every)
+        except (OSError, ValueError) as e:
+            print(f"Cannot aggregate {args.log}: {e}", file=sys.stderr)
+            return 1
+        print_summary(aggregator)
+    elif args.kind == "cylinder":
+        base_amount, subsidy, total = calculate_bill(args.type, args.quantity, args.delivery, args.subsidy)
+        print(f"Base Amount        : Rs. {base_amount:.2f}")
+        print(f"Subsidy            : Rs. {subsidy:.2f}")
+        print(f"Delivery Charges   : Rs. {args.delivery:.2f}")
+        print(f"Total Bill Amount  : Rs. {total:.2f}")
+    else:
+        services = [s.strip() for s in args.services.split(",") if s.strip()]
+        dc, vc, tax, total = sim_bill(args.data_gb, args.plan, services)
+        print(f"Data Charges (DC): Rs. {dc:.2f}")
+        print(f"Value-added Charges (VC): Rs. {vc:.2f}")
+        print(f"Tax (18% GST): Rs. {tax:.2f}")
+        print(f"Total Bill Amount: Rs. {total:.2f}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aiac", description="AI-assisted coding lab utilities.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("primes", help="test numbers for primality")
+    p.add_argument("numbers", nargs="*", type=int)
+    p.add_argument("--upto", type=int, help="list every prime up to this number")
+    p.set_defaults(func=_primes)
+
+    p = sub.add_parser("factorial", help="factorial of a non-negative integer")
+    p.add_argument("n", type=int)
+    p.set_defaults(func=_factorial)
+
+    p = sub.add_parser("sort", help="sort integers")
+    p.add_argument("values", nargs="+", type=int)
+    p.add_argument("--algorithm", choices=["quick", "bubble"], default="quick")
+    p.set_defaults(func=_sort)
+
+    p = sub.add_parser("armstrong", help="check Armstrong numbers")
+    p.add_argument("numbers", nargs="+", type=int)
+    p.set_defaults(func=_armstrong)
+
+    p = sub.add_parser("weather", help="current weather from OpenWeather")
+    p.add_argument("city", nargs="?", help="city name (prompted for if omitted)")
+    p.add_argument("--units", choices=["standard", "metric", "imperial"], default="metric")
+    p.add_argument("--json", action="store_true", help="print raw JSON output")
+    p.add_argument("--dotenv-dir", help="folder whose .env is searched before the working directory's")
+    p.set_defaults(func=_weather)
+
+    p = sub.add_parser("users", help="list or register users")
+    p.add_argument("action", choices=["list", "add"], nargs="?", default="list")
+    p.add_argument("--file", default="users.json")
+    p.add_argument("--name")
+    p.add_argument("--email")
+    p.add_argument("--password")
+    p.set_defaults(func=_users)
+
+    p = sub.add_parser("recommend", help="recommend similar products")
+    p.add_argument("product")
+    p.add_argument("--top", type=int, default=3)
+    p.set_defaults(func=_recommend)
+
+    p = sub.add_parser("billing", help="LPG cylinder or SIM data bill, or booking log totals")
+    kinds = p.add_subparsers(dest="kind", required=True)
+    c = kinds.add_parser("cylinder")
+    c.add_argument("type", help="e.g. 'Domestic 14.2kg'")
+    c.add_argument("quantity", type=int)
+    c.add_argument("--delivery", type=float, default=0.0)
+    c.add_argument("--subsidy", type=float, default=0.0)
+    s = kinds.add_parser("sim")
+    s.add_argument("data_gb", type=float)
+    s.add_argument("--plan", choices=["pre-paid", "post-paid"], default="pre-paid")
+    s.add_argument("--services", default="", help="comma separated, e.g. 'caller tune, ott subscription'")
+    g = kinds.add_parser("log", help="aggregate a CSV booking log")
+    g.add_argument("log", help="date,customer,cylinder_type,quantity,delivery_charges[,subsidy] lines")
+    g.add_argument("--checkpoint", help="checkpoint file used to resume aggregation")
+    g.add_argument("--checkpoint-every", type=_positive_int, default=1000, help="bookings between checkpoints")
+    p.set_defaults(func=_billing)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
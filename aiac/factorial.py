@@ -0,0 +1,11 @@
+"""Factorial (the iterative version from Lab 4)."""
+
+
+def factorial(n: int) -> int:
+    """Calculate the factorial of a non-negative integer n."""
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers.")
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
@@ -0,0 +1,27 @@
+"""Primality test (the context-managed 6k +/- 1 version from Lab 3)."""
+
+from typing import List
+
+from hotpath import instrument
+
+
+@instrument("primes.is_prime")
+def is_prime(n: int) -> bool:
+    """Return True if n is prime."""
+    if n <= 1:
+        return False
+    if n <= 3:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+
+def primes_up_to(limit: int) -> List[int]:
+    """Return every prime <= limit."""
+    return [n for n in range(2, limit + 1) if is_prime(n)]
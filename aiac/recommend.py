@@ -0,0 +1,69 @@
+"""
+Content-based product recommendations (Lab 5, Task 5).
+
+The TF-IDF model is fitted on the first recommendation rather than at import,
+so scikit-learn and NumPy are only loaded when they are actually needed.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from hotpath import instrument
+
+PRODUCTS: List[Dict[str, Any]] = [
+    {"id": 1, "name": "iPhone 14", "category": "Smartphone", "brand": "Apple", "price": 799, "rating": 4.7},
+    {"id": 2, "name": "Samsung Galaxy S23", "category": "Smartphone", "brand": "Samsung", "price": 749, "rating": 4.6},
+    {"id": 3, "name": "MacBook Air", "category": "Laptop", "brand": "Apple", "price": 999, "rating": 4.8},
+    {"id": 4, "name": "Dell XPS 13", "category": "Laptop", "brand": "Dell", "price": 899, "rating": 4.5},
+    {"id": 5, "name": "iPad Pro", "category": "Tablet", "brand": "Apple", "price": 799, "rating": 4.7},
+    {"id": 6, "name": "Samsung Galaxy Tab", "category": "Tablet", "brand": "Samsung", "price": 699, "rating": 4.4},
+]
+
+
+@lru_cache(maxsize=None)
+def similarity_matrix() -> Any:
+    """Return the cosine similarity of the products' category + brand TF-IDF vectors."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    corpus = [p["category"] + " " + p["brand"] for p in PRODUCTS]
+    return cosine_similarity(TfidfVectorizer().fit_transform(corpus))
+
+
+def _find_product(product_name: str) -> Optional[int]:
+    for idx, p in enumerate(PRODUCTS):
+        if p["name"].lower() == product_name.lower():
+            return idx
+    return None
+
+
+@instrument("recommend.recommend_products")
+def recommend_products(product_name: str, top_n: int = 3) -> List[Dict[str, Any]]:
+    """Return up to `top_n` products similar to `product_name`, with reasons."""
+    product_idx = _find_product(product_name)
+    if product_idx is None:
+        raise KeyError(f"Product '{product_name}' not found.")
+
+    scores = sorted(enumerate(similarity_matrix()[product_idx]), key=lambda x: x[1], reverse=True)
+    target = PRODUCTS[product_idx]
+
+    recommendations = []
+    for idx, score in [s for s in scores if s[0] != product_idx][:top_n]:
+        candidate = PRODUCTS[idx]
+        reasons = []
+        if target["category"] == candidate["category"]:
+            reasons.append("Same category")
+        if target["brand"] == candidate["brand"]:
+            reasons.append("Same brand")
+        if abs(target["price"] - candidate["price"]) <= 100:
+            reasons.append("Similar price range")
+        if target["rating"] >= 4.5 and candidate["rating"] >= 4.5:
+            reasons.append("Both are highly rated")
+
+        recommendations.append({
+            "product": candidate["name"],
+            "similarity": round(float(score), 2),
+            "reasons": reasons or ["Similar customer preferences"],
+        })
+
+    return recommendations
@@ -0,0 +1,41 @@
+"""User registry stored as JSON with SHA-256 password hashes (Lab 5, Task 2)."""
+
+import hashlib
+import json
+import os
+from typing import Dict
+
+from hotpath import instrument
+
+USER_FILE = "users.json"
+
+Users = Dict[str, Dict[str, str]]
+
+
+def load_users(path: str = USER_FILE) -> Users:
+    """Return the users stored at `path`, keyed by email."""
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return {}
+
+
+@instrument("users.save_users")
+def save_users(users: Users, path: str = USER_FILE) -> None:
+    with open(path, "w") as f:
+        json.dump(users, f, indent=4)
+
+
+@instrument("users.hash_password")
+def hash_password(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def register_user(name: str, email: str, password: str, path: str = USER_FILE) -> bool:
+    """Add a user; returns False if the email is already registered."""
+    users = load_users(path)
+    if email in users:
+        return False
+    users[email] = {"name": name, "password": hash_password(password)}
+    save_users(users, path)
+    return True
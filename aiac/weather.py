@@ -0,0 +1,118 @@
+"""
+OpenWeather current-weather lookup (Lab 5, Task 1).
+
+`requests` is imported on the first call so importing this module stays cheap.
+"""
+
+import getpass
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from hotpath import instrument
+
+OPENWEATHER_ENDPOINT = "https://api.openweathermap.org/data/2.5/weather"
+ENV_VAR_NAME = "OPENWEATHER_API_KEY"
+DOTENV_FILENAME = ".env"
+
+
+def _parse_local_dotenv(dotenv_path: Path) -> Dict[str, str]:
+    env: Dict[str, str] = {}
+    if not dotenv_path.exists():
+        return env
+    for line in dotenv_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        k, v = line.split("=", 1)
+        env[k.strip()] = v.strip().strip('"').strip("'")
+    return env
+
+
+def _ensure_api_key_interactive(dotenv_path: Path) -> Optional[str]:
+    print(f"[!] {ENV_VAR_NAME} not found. Enter your OpenWeather API key (input hidden).")
+    api_key = getpass.getpass("API key: ").strip()
+    if not api_key:
+        return None
+    choice = input("Save this key to .env for future runs? [y/N]: ").strip().lower()
+    if choice == "y":
+        env = _parse_local_dotenv(dotenv_path)
+        env[ENV_VAR_NAME] = api_key
+        lines = [f"{k}={env[k]}" for k in env]
+        dotenv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        print(f"[✓] Saved to {dotenv_path} (remember to add it to .gitignore).")
+    os.environ[ENV_VAR_NAME] = api_key
+    return api_key
+
+
+def load_api_key(interactive: bool = False, dotenv_dir: Optional[Path] = None) -> Optional[str]:
+    """
+    Return the API key from the environment or a .env file, looking in
+    `dotenv_dir` (e.g. the calling script's folder) first and then in the
+    working directory. With `interactive`, prompt for a missing key
+    (optionally saving it to the first of those .env files).
+    """
+    api_key = os.getenv(ENV_VAR_NAME)
+    if api_key:
+        return api_key.strip()
+    candidates = [Path(dotenv_dir) / DOTENV_FILENAME] if dotenv_dir else []
+    candidates.append(Path.cwd() / DOTENV_FILENAME)
+    for dotenv_path in candidates:
+        env = _parse_local_dotenv(dotenv_path)
+        if ENV_VAR_NAME in env:
+            os.environ[ENV_VAR_NAME] = env[ENV_VAR_NAME].strip()
+            return env[ENV_VAR_NAME].strip()
+    if interactive:
+        return _ensure_api_key_interactive(candidates[0])
+    return None
+
+
+@instrument("weather.fetch_weather")
+def fetch_weather(city: str, units: str = "metric", timeout: float = 8.0,
+                  api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Return {"data": {...}} for `city`, or {"error": ...} if the lookup failed."""
+    import requests
+
+    api_key = api_key or load_api_key()
+    if not api_key:
+        return {"error": f"{ENV_VAR_NAME} missing. Cannot proceed."}
+    params = {"q": city, "appid": api_key, "units": units}
+    try:
+        resp = requests.get(OPENWEATHER_ENDPOINT, params=params, timeout=timeout)
+        if resp.status_code == 200:
+            payload = resp.json()
+            return {"data": {
+                "city": payload.get("name", city),
+                "country": payload.get("sys", {}).get("country"),
+                "temperature": payload.get("main", {}).get("temp"),
+                "feels_like": payload.get("main", {}).get("feels_like"),
+                "humidity": payload.get("main", {}).get("humidity"),
+                "pressure": payload.get("main", {}).get("pressure"),
+                "wind_speed": payload.get("wind", {}).get("speed"),
+                "weather": (payload.get("weather") or [{}])[0].get("description"),
+                "units": units,
+            }}
+        elif resp.status_code == 401:
+            return {"error": "Unauthorized. Check your API key (401)."}
+        elif resp.status_code == 404:
+            return {"error": f"City '{city}' not found (404)."}
+        else:
+            return {"error": f"OpenWeather error {resp.status_code}", "detail": resp.text}
+    except requests.Timeout:
+        return {"error": "Request timed out."}
+    except requests.RequestException as e:
+        return {"error": f"Network error: {e}"}
+
+
+def format_weather(data: Dict[str, Any]) -> str:
+    """Return the `data` of a successful fetch_weather() as a readable report."""
+    city_line = f"{data['city']}" + (f", {data['country']}" if data.get("country") else "")
+    return "\n".join([
+        f"Weather in {city_line}:",
+        f"  Description : {data.get('weather')}",
+        f"  Temperature : {data.get('temperature')}° ({data.get('units')})",
+        f"  Feels like  : {data.get('feels_like')}°",
+        f"  Humidity    : {data.get('humidity')}%",
+        f"  Pressure    : {data.get('pressure')} hPa",
+        f"  Wind speed  : {data.get('wind_speed')}",
+    ])
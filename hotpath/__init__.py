@@ -0,0 +1,48 @@
+"""
+Lightweight hot-path instrumentation.
+
+    from hotpath import instrument, timed
+
+    @instrument("sorting.quicksort")
+    def quicksort(arr): ...
+
+Enable with AIAC_INSTRUMENT=1, or `configure(enabled=True)` before importing
+the instrumented modules (disabled @instrument returns the function as is):
+
+    AIAC_INSTRUMENT_SAMPLE=N       profile every Nth call with cProfile (kept out of latency)
+    AIAC_INSTRUMENT_TRACEMALLOC=1  record peak memory of sampled calls
+    AIAC_INSTRUMENT_DUMP=path      write metrics at exit (.prom/.txt -> Prometheus, else JSON)
+"""
+
+from .core import (
+    Config,
+    Metric,
+    Registry,
+    config,
+    configure,
+    increment,
+    instrument,
+    profile_report,
+    registry,
+    timed,
+)
+from .export import dump, snapshot, to_json, to_prometheus
+from .histogram import Histogram
+
+__all__ = [
+    "Config",
+    "Histogram",
+    "Metric",
+    "Registry",
+    "config",
+    "configure",
+    "dump",
+    "increment",
+    "instrument",
+    "profile_report",
+    "registry",
+    "snapshot",
+    "timed",
+    "to_json",
+    "to_prometheus",
+]
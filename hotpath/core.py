@@ -0,0 +1,241 @@
+"""
+Call counters, latency histograms and sampled profiling.
+
+Instrumentation is off unless enabled with the AIAC_INSTRUMENT environment
+variable or `configure(enabled=True)`. @instrument decides at decoration time:
+while off it returns the function unchanged, so it costs nothing, but that
+also means instrumentation must be enabled before the instrumented modules
+are imported. `timed` and `increment` follow the switch at every call.
+"""
+
+import atexit
+import functools
+import io
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .histogram import Histogram
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+class Config:
+    """Runtime switches for the instrumentation layer."""
+
+    __slots__ = ("enabled", "sample_every", "trace_memory")
+
+    def __init__(self) -> None:
+        self.enabled = os.getenv("AIAC_INSTRUMENT", "").strip().lower() in _TRUE_VALUES
+        # Profile every Nth call of each metric with cProfile (0 disables sampling)
+        self.sample_every = int(os.getenv("AIAC_INSTRUMENT_SAMPLE", "0") or 0)
+        # Also record peak traced memory for sampled calls
+        self.trace_memory = os.getenv("AIAC_INSTRUMENT_TRACEMALLOC", "").strip().lower() in _TRUE_VALUES
+
+
+class Metric:
+    """Everything recorded for one instrumented function or block."""
+
+    __slots__ = ("name", "calls", "errors", "latency", "memory_peak", "profile", "samples")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.memory_peak = 0
+        self.profile: Optional[Any] = None  # pstats.Stats once a call has been sampled
+        self.samples = 0
+
+
+class Registry:
+    """Holds metrics and plain counters by name."""
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, Metric] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def metric(self, name: str) -> Metric:
+        metric = self.metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.metrics.setdefault(name, Metric(name))
+        return metric
+
+    def record(self, name: str, elapsed_ns: int, failed: bool = False, sampled: bool = False) -> None:
+        """
+        Count one call and add its latency to the histogram.
+
+        A `sampled` call ran under the profilers, which slow it down, so it is
+        counted but its latency is left out of the histogram.
+        """
+        metric = self.metric(name)
+        with self._lock:
+            metric.calls += 1
+            if failed:
+                metric.errors += 1
+            if not sampled:
+                metric.latency.record(elapsed_ns)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.metrics.clear()
+            self.counters.clear()
+
+
+config = Config()
+registry = Registry()
+_profiling = threading.local()
+
+
+def configure(enabled: Optional[bool] = None, sample_every: Optional[int] = None,
+              trace_memory: Optional[bool] = None) -> Config:
+    """
+    Update the instrumentation switches; arguments left as None are unchanged.
+
+    Enabling only affects functions decorated afterwards (see `instrument`).
+    """
+    if enabled is not None:
+        config.enabled = enabled
+    if sample_every is not None:
+        config.sample_every = sample_every
+    if trace_memory is not None:
+        config.trace_memory = trace_memory
+    return config
+
+
+def increment(name: str, value: int = 1) -> None:
+    """Add `value` to a named counter (no-op while instrumentation is disabled)."""
+    if config.enabled:
+        registry.increment(name, value)
+
+
+def _should_sample(name: str) -> bool:
+    if config.sample_every <= 0 or getattr(_profiling, "active", False):
+        return False
+    # calls is incremented after the call, so the Nth call sees N - 1 here
+    return (registry.metric(name).calls + 1) % config.sample_every == 0
+
+
+def _call_sampled(name: str, func: Callable[..., Any], args: Any, kwargs: Any) -> Any:
+    """Run one call under cProfile (and tracemalloc if enabled), keeping the results."""
+    # Imported here: the profilers are slow to import and only needed when sampling
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    metric = registry.metric(name)
+    profiler = cProfile.Profile()
+    started_tracing = config.trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif config.trace_memory:
+        tracemalloc.reset_peak()
+    _profiling.active = True
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        _profiling.active = False
+        if config.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            metric.memory_peak = max(metric.memory_peak, peak)
+        if metric.profile is None:
+            metric.profile = pstats.Stats(profiler)
+        else:
+            metric.profile.add(profiler)
+        metric.samples += 1
+
+
+def instrument(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator recording call count, errors and latency of a function.
+    Calls sampled for profiling are counted but not timed (see Registry.record).
+
+    The metric is named `name`, defaulting to "<module>.<qualname>". If
+    instrumentation is disabled when the function is decorated, it is returned
+    unwrapped.
+    """
+
+    def decorate(func: F) -> F:
+        if not config.enabled:
+            return func
+        metric_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not config.enabled:
+                return func(*args, **kwargs)
+            sampled = _should_sample(metric_name)
+            failed = True
+            start = time.perf_counter_ns()
+            try:
+                if sampled:
+                    result = _call_sampled(metric_name, func, args, kwargs)
+                else:
+                    result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                registry.record(metric_name, time.perf_counter_ns() - start, failed, sampled)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+class timed:
+    """
+    Context manager recording the latency of a block under `name`.
+
+        with timed("users.save"):
+            ...
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._start = 0
+
+    def __enter__(self) -> "timed":
+        if config.enabled:
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if config.enabled and self._start:
+            registry.record(self.name, time.perf_counter_ns() - self._start, exc_type is not None)
+            self._start = 0
+
+
+def profile_report(name: str, limit: int = 20, sort: str = "cumulative") -> str:
+    """Return the accumulated cProfile statistics of a metric as text."""
+    metric = registry.metrics.get(name)
+    if metric is None or metric.profile is None:
+        return ""
+    out = io.StringIO()
+    metric.profile.stream = out  # type: ignore[attr-defined]
+    metric.profile.sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def _dump_at_exit(path: str) -> None:
+    from .export import dump
+
+    if registry.metrics or registry.counters:
+        dump(path)
+
+
+_dump_path = os.getenv("AIAC_INSTRUMENT_DUMP")
+if config.enabled and _dump_path:
+    atexit.register(_dump_at_exit, _dump_path)
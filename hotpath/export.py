@@ -0,0 +1,102 @@
+"""Dump collected metrics as JSON or Prometheus text exposition format."""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from .core import Registry, registry as default_registry
+
+PERCENTILES = (50, 90, 99, 99.9)
+# Fixed `le` boundaries of the Prometheus latency histogram: powers of two from
+# ~1us to ~34s, in nanoseconds. Stable across scrapes and processes, unlike the
+# HDR buckets, which only exist once hit; those are kept in the JSON snapshot.
+PROMETHEUS_BOUNDS_NS = tuple(1 << bits for bits in range(10, 36))
+
+
+def snapshot(registry: Optional[Registry] = None) -> Dict[str, Any]:
+    """Return the collected metrics as plain JSON-serializable data."""
+    registry = registry or default_registry
+    metrics = {}
+    for name, metric in sorted(registry.metrics.items()):
+        latency = metric.latency
+        metrics[name] = {
+            "calls": metric.calls,
+            "errors": metric.errors,
+            "latency_ns": {
+                "count": latency.count,
+                "sum": latency.total,
+                "min": latency.min,
+                "max": latency.max,
+                "mean": latency.mean(),
+                **{f"p{pct:g}": latency.percentile(pct) for pct in PERCENTILES},
+                "buckets": [[upper, count] for upper, count in latency.buckets()],
+            },
+            "profile_samples": metric.samples,
+            "memory_peak_bytes": metric.memory_peak,
+        }
+    return {"metrics": metrics, "counters": dict(sorted(registry.counters.items()))}
+
+
+def to_json(registry: Optional[Registry] = None, indent: Optional[int] = 2) -> str:
+    return json.dumps(snapshot(registry), indent=indent)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_prometheus(registry: Optional[Registry] = None, prefix: str = "aiac",
+                  bounds_ns: Sequence[int] = PROMETHEUS_BOUNDS_NS) -> str:
+    """
+    Render the metrics in the Prometheus text exposition format (latency in seconds).
+
+    Latency is exported with the cumulative `le` boundaries `bounds_ns`
+    (ascending nanoseconds), filled from the HDR bucket counts.
+    """
+    registry = registry or default_registry
+    lines: List[str] = []
+    metrics = sorted(registry.metrics.items())
+
+    lines.append(f"# HELP {prefix}_calls_total Calls of instrumented functions.")
+    lines.append(f"# TYPE {prefix}_calls_total counter")
+    for name, metric in metrics:
+        lines.append(f'{prefix}_calls_total{{name="{_label(name)}"}} {metric.calls}')
+
+    lines.append(f"# HELP {prefix}_errors_total Calls that raised an exception.")
+    lines.append(f"# TYPE {prefix}_errors_total counter")
+    for name, metric in metrics:
+        lines.append(f'{prefix}_errors_total{{name="{_label(name)}"}} {metric.errors}')
+
+    lines.append(f"# HELP {prefix}_call_duration_seconds Latency of instrumented functions.")
+    lines.append(f"# TYPE {prefix}_call_duration_seconds histogram")
+    for name, metric in metrics:
+        label = f'name="{_label(name)}"'
+        for bound, cumulative in zip(bounds_ns, metric.latency.cumulative_counts(bounds_ns)):
+            lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="{bound / 1e9:.12g}"}} {cumulative}')
+        lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="+Inf"}} {metric.latency.count}')
+        lines.append(f"{prefix}_call_duration_seconds_sum{{{label}}} {metric.latency.total / 1e9:.9g}")
+        lines.append(f"{prefix}_call_duration_seconds_count{{{label}}} {metric.latency.count}")
+
+    if any(metric.samples for _, metric in metrics):
+        lines.append(f"# HELP {prefix}_memory_peak_bytes Peak traced memory of sampled calls.")
+        lines.append(f"# TYPE {prefix}_memory_peak_bytes gauge")
+        for name, metric in metrics:
+            if metric.samples:
+                lines.append(f'{prefix}_memory_peak_bytes{{name="{_label(name)}"}} {metric.memory_peak}')
+
+    if registry.counters:
+        lines.append(f"# HELP {prefix}_events_total Named event counters.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(registry.counters.items()):
+            lines.append(f'{prefix}_events_total{{name="{_label(name)}"}} {value}')
+
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: str, registry: Optional[Registry] = None) -> None:
+    """Write the metrics to `path`: Prometheus text for *.prom / *.txt, JSON otherwise."""
+    if path.endswith((".prom", ".txt")):
+        text = to_prometheus(registry)
+    else:
+        text = to_json(registry)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,94 @@
+"""
+HDR-style latency histogram.
+
+Values (nanoseconds) are grouped into log-linear buckets: every power of two
+is split into SUB_BUCKETS // 2 equal sub-buckets, so each bucket is within
+~3% of the values it holds no matter how large they are. Only buckets that
+have been hit are stored.
+"""
+
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS        # values below this get one bucket each
+HALF_SUB_BUCKETS = SUB_BUCKETS >> 1
+
+
+def bucket_index(value: int) -> int:
+    """Return the bucket index holding a non-negative integer value."""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the inclusive (lowest, highest) values that fall in a bucket."""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    sub = index - (shift << (SUB_BUCKET_BITS - 1))
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+class Histogram:
+    """Sparse log-linear histogram with count, sum, min and max."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            value = 0
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """Yield (upper_bound, count) for every non-empty bucket in ascending order."""
+        for index in sorted(self.counts):
+            yield bucket_bounds(index)[1], self.counts[index]
+
+    def cumulative_counts(self, bounds: Sequence[int]) -> List[int]:
+        """
+        Return how many values are at most each of the ascending `bounds`.
+
+        Counts are to bucket precision: a bucket is included once its highest
+        value is within the bound.
+        """
+        result: List[int] = []
+        buckets = self.buckets()
+        pending = next(buckets, None)
+        seen = 0
+        for bound in bounds:
+            while pending is not None and pending[0] <= bound:
+                seen += pending[1]
+                pending = next(buckets, None)
+            result.append(seen)
+        return result
+
+    def percentile(self, pct: float) -> int:
+        """Return the upper bound of the bucket containing the given percentile."""
+        if self.count == 0:
+            return 0
+        target = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for upper, count in self.buckets():
+            seen += count
+            if seen >= target:
+                return min(upper, self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
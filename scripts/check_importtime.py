@@ -0,0 +1,98 @@
+"""
+Import-time budget check for the aiac and hotpath packages.
+
+Imports every library module with `python -X importtime` in a fresh
+interpreter and fails if the cumulative import time of a module exceeds the
+budget, if a heavy dependency (requests, scikit-learn, NumPy) was imported at
+all, or if the import itself failed. tests/test_importtime.py runs this check
+as part of the test suite.
+
+    python scripts/check_importtime.py [--budget-ms 60] [--runs 5]
+"""
+
+import argparse
+import os
+import pkgutil
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PACKAGES = ("aiac", "hotpath")
+HEAVY_MODULES = ("requests", "sklearn", "numpy", "scipy")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+class ImportFailed(Exception):
+    """The module could not be imported; the message is the last error line."""
+
+
+def library_modules() -> Iterator[str]:
+    """Yield every module of the checked packages (except __main__, which runs the CLI)."""
+    for package in PACKAGES:
+        yield package
+        for info in pkgutil.iter_modules([str(REPO_ROOT / package)]):
+            if info.name != "__main__":
+                yield f"{package}.{info.name}"
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Return {module: cumulative microseconds} for a cold `import module`."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode:
+        errors = [line for line in proc.stderr.splitlines() if line and not _LINE.match(line)]
+        raise ImportFailed(errors[-1] if errors else f"exit status {proc.returncode}")
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def check(budget_ms: float, runs: int) -> List[Tuple[str, Optional[float], str]]:
+    """Return (module, fastest import in ms or None, status) for every library module."""
+    results = []
+    for module in library_modules():
+        try:
+            timings = [import_times(module) for _ in range(runs)]
+        except ImportFailed as e:
+            results.append((module, None, f"FAIL: import failed: {e}"))
+            continue
+        heavy = sorted({name for times in timings for name in times
+                        if name.split(".")[0] in HEAVY_MODULES})
+        best_ms = min(times[module] for times in timings) / 1000
+        status = "ok"
+        if heavy:
+            status = f"FAIL: imports {', '.join(heavy)}"
+        elif best_ms > budget_ms:
+            status = f"FAIL: over {budget_ms:g} ms budget"
+        results.append((module, best_ms, status))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=60.0,
+                        help="maximum cumulative import time of each checked module")
+    parser.add_argument("--runs", type=int, default=5, help="take the fastest of this many runs")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, best_ms, status in check(args.budget_ms, args.runs):
+        failed = failed or status != "ok"
+        timing = "-" if best_ms is None else f"{best_ms:.1f}"
+        print(f"{module:<20} {timing:>8} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+
+from aiac import billing
+
+HEADER = "date,customer,cylinder_type,quantity,delivery_charges,subsidy\n"
+
+
+def write_log(path, *lines, header=True):
+    path.write_text((HEADER if header else "") + "".join(lines), encoding="utf-8")
+    return str(path)
+
+
+def test_resume_after_append_processes_only_new_bookings(tmp_path):
+    log = write_log(tmp_path / "bookings.csv", "2026-01-01,amy,Domestic 5kg,1,10,0\n")
+    checkpoint = str(tmp_path / "ck.json")
+
+    first = billing.process_bookings(log, checkpoint)
+    assert first.by_customer == {"amy": [1, 1, 345.5]}
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("2026-01-02,bob,Commercial 19kg,2,20\n")
+    resumed = billing.process_bookings(log, checkpoint)
+
+    assert resumed.by_customer == {"amy": [1, 1, 345.5], "bob": [1, 2, 3793.0]}
+    assert resumed.by_day["2026-01-02"] == [1, 2, 3793.0]
+    assert resumed.offset == Path(log).stat().st_size
+
+
+def test_unfinished_last_line_is_read_again_once_complete(tmp_path):
+    log = write_log(tmp_path / "bookings.csv", "2026-01-01,bob,Domestic 5kg,1")
+    checkpoint = str(tmp_path / "ck.json")
+
+    partial = billing.process_bookings(log, checkpoint)
+    assert partial.by_customer == {}
+    assert partial.rejected == 0
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(",15\n")
+    complete = billing.process_bookings(log, checkpoint)
+    assert complete.by_customer == {"bob": [1, 1, 350.5]}
+
+
+def test_resume_against_a_different_log_is_refused(tmp_path):
+    checkpoint = str(tmp_path / "ck.json")
+    day1 = write_log(tmp_path / "day1.csv", "2026-01-01,amy,Domestic 5kg,1,10,0\n")
+    billing.process_bookings(day1, checkpoint)
+
+    day2 = write_log(tmp_path / "day2.csv", "2026-01-02,bob,Domestic 5kg,1,10,0\n")
+    with pytest.raises(ValueError, match="does not match"):
+        billing.process_bookings(day2, checkpoint)
+
+
+def test_resume_against_a_replaced_log_is_refused(tmp_path):
+    checkpoint = str(tmp_path / "ck.json")
+    log = write_log(tmp_path / "bookings.csv", "2026-01-01,amy,Domestic 5kg,1,10,0\n")
+    billing.process_bookings(log, checkpoint)
+
+    write_log(tmp_path / "bookings.csv", "2026-01-02,zed,Domestic 5kg,1,10,0\n", header=False)
+    with pytest.raises(ValueError):
+        billing.process_bookings(log, checkpoint)
+
+
+def test_customers_beyond_the_cap_are_pooled(tmp_path):
+    log = write_log(
+        tmp_path / "bookings.csv",
+        "2026-01-01,amy,Domestic 5kg,1,0,0\n",
+        "2026-01-01,bob,Domestic 5kg,1,0,0\n",
+        "2026-01-01,cat,Domestic 5kg,1,0,0\n",
+        "2026-01-01,amy,Domestic 5kg,1,0,0\n",
+    )
+    aggregator = billing.process_bookings(log, max_customers=2)
+
+    assert aggregator.by_customer == {
+        "amy": [2, 2, 671.0],
+        "bob": [1, 1, 335.5],
+        billing.OTHER_CUSTOMERS: [1, 1, 335.5],
+    }
+
+
+def test_resume_applies_the_callers_customer_cap(tmp_path):
+    checkpoint = str(tmp_path / "ck.json")
+    log = write_log(tmp_path / "bookings.csv", "2026-01-01,amy,Domestic 5kg,1,0,0\n")
+    billing.process_bookings(log, checkpoint, max_customers=5)
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("2026-01-01,bob,Domestic 5kg,1,0,0\n")
+    resumed = billing.process_bookings(log, checkpoint, max_customers=1)
+
+    assert resumed.max_customers == 1
+    assert set(resumed.by_customer) == {"amy", billing.OTHER_CUSTOMERS}
+
+
+def test_malformed_bookings_are_counted_and_skipped(tmp_path):
+    log = write_log(
+        tmp_path / "bookings.csv",
+        "2026-01-01,amy,Domestic 5kg,x,10,0\n",
+        "2026-01-01,bob,unknown,1,10,0\n",
+        "2026-01-01,cat,Domestic 5kg\n",
+        "2026-01-01,dan,Domestic 5kg,1,10,0\n",
+    )
+    checkpoint = str(tmp_path / "ck.json")
+    aggregator = billing.process_bookings(log, checkpoint)
+
+    assert aggregator.rejected == 3
+    assert len(aggregator.errors) == 3
+    assert aggregator.errors[0].startswith(f"byte {len(HEADER)}:")
+    assert set(aggregator.by_type) == {"domestic 5kg"}
+    assert aggregator.by_customer == {"dan": [1, 1, 345.5]}
+
+    # A resumed run starts after the bad lines instead of failing on them again
+    assert billing.process_bookings(log, checkpoint).rejected == 3
+
+
+def test_checkpoint_every_must_be_positive(tmp_path):
+    log = write_log(tmp_path / "bookings.csv")
+    with pytest.raises(ValueError):
+        billing.process_bookings(log, str(tmp_path / "ck.json"), checkpoint_every=0)
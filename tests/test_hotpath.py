@@ -0,0 +1,73 @@
+import pytest
+
+from hotpath import Histogram, configure, config, instrument, registry, to_prometheus
+from hotpath.export import PROMETHEUS_BOUNDS_NS
+from hotpath.histogram import bucket_bounds, bucket_index
+
+
+@pytest.fixture
+def enabled():
+    saved = (config.enabled, config.sample_every, config.trace_memory)
+    configure(enabled=True, sample_every=0, trace_memory=False)
+    registry.reset()
+    yield registry
+    configure(*saved)
+    registry.reset()
+
+
+def test_bucket_bounds_are_contiguous_and_hold_their_values():
+    previous_high = -1
+    for index in range(bucket_index(1 << 40) + 1):
+        low, high = bucket_bounds(index)
+        assert low == previous_high + 1
+        assert bucket_index(low) == bucket_index(high) == index
+        previous_high = high
+
+
+def test_bucket_width_stays_within_relative_precision():
+    for value in (31, 32, 1000, 123456, 10 ** 9, 3 * 10 ** 11):
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+        assert high - low <= max(1, value // 16)
+
+
+def test_cumulative_counts_fill_fixed_bounds():
+    histogram = Histogram()
+    for value in (5, 1000, 1023, 1024, 5000, 10 ** 12):
+        histogram.record(value)
+
+    assert histogram.cumulative_counts([1023, 2047, 4095, 8191]) == [3, 4, 4, 5]
+    assert histogram.percentile(50) == 1023
+
+
+def test_prometheus_exports_the_same_boundaries_whatever_was_recorded(enabled):
+    fast, slow = Histogram(), Histogram()
+    fast.record(2000)
+    slow.record(3 * 10 ** 9)
+    registry.metric("fast").latency = fast
+    registry.metric("slow").latency = slow
+
+    text = to_prometheus(registry)
+    for name in ("fast", "slow"):
+        series = [line for line in text.splitlines()
+                  if line.startswith(f'aiac_call_duration_seconds_bucket{{name="{name}"')]
+        assert len(series) == len(PROMETHEUS_BOUNDS_NS) + 1
+        assert series[-1].endswith('le="+Inf"} 1')
+        counts = [int(line.rsplit(" ", 1)[1]) for line in series]
+        assert counts == sorted(counts)
+
+
+def test_sampled_calls_are_counted_but_not_timed(enabled):
+    configure(sample_every=2)
+
+    @instrument("square")
+    def square(x):
+        return x * x
+
+    for x in range(10):
+        square(x)
+
+    metric = registry.metrics["square"]
+    assert metric.calls == 10
+    assert metric.samples == 5
+    assert metric.latency.count == 5
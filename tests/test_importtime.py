@@ -0,0 +1,31 @@
+import importlib.util
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "check_importtime.py"
+
+_spec = importlib.util.spec_from_file_location("check_importtime", SCRIPT_PATH)
+check_importtime = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_importtime)
+
+
+def test_every_library_module_is_checked():
+    modules = set(check_importtime.library_modules())
+    assert {"aiac.cli", "aiac.billing", "aiac.users", "aiac.sorting", "aiac.recommend",
+            "aiac.weather", "hotpath.core"} <= modules
+    assert "aiac.__main__" not in modules
+
+
+def test_library_modules_import_quickly_without_heavy_dependencies():
+    # The budget is generous so a slow CI machine does not fail the suite;
+    # heavy dependencies and failed imports are caught whatever the budget.
+    failures = [f"{module}: {status}"
+                for module, _, status in check_importtime.check(budget_ms=500, runs=1)
+                if status != "ok"]
+    assert not failures
+
+
+def test_failed_import_is_reported_not_raised(monkeypatch):
+    monkeypatch.setattr(check_importtime, "library_modules", lambda: iter(["aiac.no_such_module"]))
+    [(module, best_ms, status)] = check_importtime.check(budget_ms=500, runs=1)
+    assert best_ms is None
+    assert status.startswith("FAIL: import failed: ModuleNotFoundError")
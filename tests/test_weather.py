@@ -0,0 +1,16 @@
+from aiac import weather
+
+
+def test_load_api_key_prefers_the_dotenv_dir_over_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv(weather.ENV_VAR_NAME, raising=False)
+    script_dir = tmp_path / "script"
+    work_dir = tmp_path / "work"
+    script_dir.mkdir()
+    work_dir.mkdir()
+    (script_dir / ".env").write_text(f'{weather.ENV_VAR_NAME}="from-script"\n', encoding="utf-8")
+    (work_dir / ".env").write_text(f"{weather.ENV_VAR_NAME}=from-cwd\n", encoding="utf-8")
+    monkeypatch.chdir(work_dir)
+
+    assert weather.load_api_key(dotenv_dir=script_dir) == "from-script"
+    monkeypatch.delenv(weather.ENV_VAR_NAME)
+    assert weather.load_api_key() == "from-cwd"